@@ -1,5 +1,5 @@
 import streamlit as st
-import requests
+import httpx
 import json
 import os
 
@@ -17,15 +17,61 @@ if not API_URL_BASE:
     st.error("ERRO DE CONFIGURAÇÃO: A variável 'JUSCASH_API_BASE_URL' não foi encontrada nos Segredos do Streamlit.")
     st.stop() # Para a execução do script
 API_VERIFY_URL = f"{API_URL_BASE}/verificar"
+API_STREAM_URL = f"{API_URL_BASE}/verificar/stream"
 
 st.set_page_config(
     page_title="JusCash LLM Verificador",
     layout="wide",
 )
 
+
+@st.cache_resource
+def get_http() -> httpx.Client:
+    # Cliente HTTP único, compartilhado entre reruns e usuários: o Streamlit
+    # reexecuta o script inteiro a cada interação, e criar uma conexão nova
+    # por submit pagaria o handshake TCP/TLS toda vez. Com o cliente cacheado
+    # as conexões keepalive são reaproveitadas.
+    return httpx.Client(
+        timeout=40.0,
+        limits=httpx.Limits(
+            max_keepalive_connections=10,
+            max_connections=20,
+            keepalive_expiry=30.0,
+        ),
+    )
+
 st.title("🛡️ Verificador de Processos Judiciais (JusCash LLM)")
 st.caption("UI para testes manuais. Chama o endpoint da API FastAPI/Gemini.")
 
+# Estruturas imutáveis fora do fluxo de rerun: o Streamlit reexecuta o script
+# inteiro a cada interação, então constantes vivem no escopo do módulo em vez
+# de serem realocadas a cada clique/tecla.
+ESFERA_OPTIONS = ("Federal", "Estadual", "Trabalhista")
+DECISION_MAP = {
+    "approved": ("✅ APROVADO", "success"),
+    "rejected": ("❌ REJEITADO", "error"),
+    "incomplete": ("⚠️ INCOMPLETO", "warning"),
+}
+
+
+def exibir_resultado(result: dict) -> None:
+    """Renderiza a decisão estruturada retornada pela API."""
+    # Formatação visual da Decisão
+    display_text, color = DECISION_MAP.get(result.get('decision', 'error'), ("❓ ERRO", "error"))
+
+    st.markdown("---")
+    st.metric(label="DECISÃO FINAL", value=display_text)
+
+    st.markdown(f"#### Justificativa (Rationale)")
+    st.code(result.get('rationale'))
+
+    st.markdown(f"#### Regras Aplicadas (Citações)")
+    st.write(f"**IDs:** `{', '.join(result.get('citacoes', ['Nenhuma']))}`")
+
+    st.markdown("---")
+    st.markdown("##### JSON Retornado pela API")
+    st.json(result)
+
 # ==============================================================================
 # 1. FORMULÁRIO DE ENTRADA (Simula o objeto ProcessoJudicial)
 # ==============================================================================
@@ -38,7 +84,7 @@ with st.form(key='verification_form'):
 
     with col1:
         numero = st.text_input("Número do Processo", value="0100000-00.2024.4.01.0000")
-        esfera = st.selectbox("Esfera Judicial (POL-4)", ["Federal", "Estadual", "Trabalhista"])
+        esfera = st.selectbox("Esfera Judicial (POL-4)", ESFERA_OPTIONS)
         valor = st.number_input("Valor da Condenação (R$) (POL-3)", value=15000.00, min_value=0.0)
         
     with col2:
@@ -67,50 +113,58 @@ if submit_button:
         "obito_autor": obito
     }
     
-    st.info(f"Aguardando resposta da API LLM em: **{API_VERIFY_URL}**") # Mostra o URL
+    st.info(f"Aguardando resposta da API LLM em: **{API_STREAM_URL}**") # Mostra o URL
     
     try:
-        # 2.2. Chama o endpoint POST da sua API FastAPI
-        # ATENÇÃO: Mudança para API_VERIFY_URL
-        response = requests.post(API_VERIFY_URL, json=payload, timeout=40)
-        
-        # 2.3. Processamento da Resposta
-        if response.status_code == 200:
-            # Sucesso na verificação
-            result = response.json()
-            
-            # Formatação visual da Decisão
-            decision_map = {
-                "approved": ("✅ APROVADO", "success"),
-                "rejected": ("❌ REJEITADO", "error"),
-                "incomplete": ("⚠️ INCOMPLETO", "warning")
-            }
-            display_text, color = decision_map.get(result.get('decision', 'error'), ("❓ ERRO", "error"))
-            
-            st.markdown("---")
-            st.metric(label="DECISÃO FINAL", value=display_text)
-            
-            st.markdown(f"#### Justificativa (Rationale)")
-            st.code(result.get('rationale'))
-            
-            st.markdown(f"#### Regras Aplicadas (Citações)")
-            st.write(f"**IDs:** `{', '.join(result.get('citacoes', ['Nenhuma']))}`")
-            
-            st.markdown("---")
-            st.markdown("##### JSON Retornado pela API")
-            st.json(result)
-            
-        elif response.status_code == 422:
-            # Erro de validação do Pydantic (FastAPI)
-            st.error("Erro de Validação: O JSON enviado não corresponde ao schema esperado. Verifique os tipos de dados.")
-            st.json(response.json())
-
-        else:
-            # Outros erros da API (500, 503, etc.)
-            error_detail = response.json().get('detail', 'Nenhuma mensagem de erro fornecida.')
-            st.error(f"Erro na API (Código {response.status_code}): {error_detail}")
+        # 2.2. Chama o endpoint SSE da API e consome os eventos conforme chegam
+        with get_http().stream("POST", API_STREAM_URL, json=payload) as response:
+            if response.status_code == 200:
+                # 2.3. Renderização progressiva: cada chunk atualiza a área
+                progresso = st.empty()
+                acumulado = ""
+                erro_llm = None
+                evento = "message"
+                for linha in response.iter_lines():
+                    if linha.startswith("event: "):
+                        evento = linha[7:].strip()
+                    elif linha.startswith("data: "):
+                        dado = json.loads(linha[6:])
+                        if evento == "error":
+                            erro_llm = dado
+                            break
+                        if dado == "[DONE]":
+                            break
+                        acumulado += dado
+                        progresso.code(acumulado)
+
+                if erro_llm is not None:
+                    # Fallback: antes de desistir, tenta o endpoint não-stream
+                    # (o /verificar continua disponível para chamadas diretas).
+                    progresso.empty()
+                    fallback = get_http().post(API_VERIFY_URL, json=payload)
+                    if fallback.status_code == 200:
+                        exibir_resultado(fallback.json())
+                    else:
+                        st.error(f"Erro no Serviço LLM: {erro_llm}")
+                else:
+                    progresso.empty()
+                    exibir_resultado(json.loads(acumulado))
+
+            elif response.status_code == 422:
+                # Erro de validação do Pydantic (FastAPI)
+                response.read()
+                st.error("Erro de Validação: O JSON enviado não corresponde ao schema esperado. Verifique os tipos de dados.")
+                st.json(response.json())
+
+            else:
+                # Outros erros da API (500, 503, etc.)
+                response.read()
+                error_detail = response.json().get('detail', 'Nenhuma mensagem de erro fornecida.')
+                st.error(f"Erro na API (Código {response.status_code}): {error_detail}")
             
-    except requests.exceptions.ConnectionError:
+    except httpx.TimeoutException:
+        st.error("TIMEOUT: A API demorou mais de 40s para responder (o LLM pode estar lento).")
+    except httpx.TransportError:
         st.error(f"ERRO DE CONEXÃO: A API FastAPI não está rodando em {API_URL_BASE}.")
         st.warning("Verifique se o seu container Docker/Serviço Cloud está a correr corretamente.")
     except Exception as e:
@@ -1,15 +1,24 @@
 import os
 import json
-from typing import List, Dict
+import time
+import asyncio
+import hashlib
+from typing import List, Dict, Optional
+
+from cachetools import TTLCache
 
 # --- Dependências da API ---
+import orjson
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from uvicorn import run as uvicorn_run
 
 # --- Dependências do Módulo de Verificação LLM ---
-from pydantic import BaseModel, Field
+import httpx
+from pydantic import BaseModel, Field, TypeAdapter
 from google import genai
 from google.genai import types
+from google.genai import errors as genai_errors
 
 
 # ==============================================================================
@@ -46,6 +55,11 @@ class ProcessoJudicial(BaseModel):
     obito_autor: bool = Field(description="True se houver óbito do autor sem habilitação (p/ POL-5).")
 
 
+# Validador compilado uma única vez (pydantic-core/Rust): mais barato no
+# caminho quente do que o classmethod model_validate_json a cada chamada.
+_DECISAO_ADAPTER = TypeAdapter(DecisaoProcesso)
+
+
 # ==============================================================================
 # 2. POLÍTICA E LLM (Lógica de Negócio)
 # ==============================================================================
@@ -53,6 +67,61 @@ class ProcessoJudicial(BaseModel):
 # Variável global para armazenar a chave de API, lida do ambiente.
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
+# Cliente Gemini ÚNICO, criado no import (singleton). Construir o cliente a
+# cada requisição recria o transporte httpx (pool de conexões próprio) e paga
+# handshake TCP+TLS a cada chamada; reutilizando o cliente, as conexões
+# keepalive são aproveitadas entre requisições.
+if not GEMINI_API_KEY:
+    # Falha imediata no startup: melhor do que responder 500 em cada request.
+    raise RuntimeError("Chave GEMINI_API_KEY não configurada no ambiente.")
+
+# Cache exato em memória: payloads byte-idênticos voltam em sub-ms, sem nem
+# passar pelo caminho de embedding/busca vetorial do cache semântico.
+# (TTLCache porque objetos Pydantic não são hasháveis para lru_cache.)
+_EXACT_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+# Cache semântico (Redis) opcional: ativado quando REDIS_URL estiver definida.
+# Payloads repetidos/quase-idênticos respondem em dezenas de ms sem pagar o
+# round-trip (multi-segundos) nem os tokens do Gemini.
+REDIS_URL = os.getenv("REDIS_URL")
+
+_SEMANTIC_CACHE = None
+if REDIS_URL:
+    try:
+        from redisvl.extensions.cache.llm import SemanticCache
+        from redisvl.utils.vectorize import HFTextVectorizer
+
+        _SEMANTIC_CACHE = SemanticCache(
+            name="juscash_llm",
+            redis_url=REDIS_URL,
+            distance_threshold=0.1,
+            vectorizer=HFTextVectorizer("redis/langcache-embed-v1"),
+        )
+    except Exception as e:
+        # Sem Redis/redisvl o serviço continua funcionando, só sem cache.
+        print(f"Aviso: cache semântico desativado ({e})")
+
+# Limites do pool httpx por baixo do cliente: os defaults (10 keepalive /
+# 100 máx) estrangulam quando muitas verificações correm em paralelo sobre o
+# mesmo cliente compartilhado.
+_HTTPX_LIMITS = httpx.Limits(
+    max_keepalive_connections=40,
+    max_connections=100,
+    keepalive_expiry=30.0,
+)
+
+_GEMINI_CLIENT = genai.Client(
+    api_key=GEMINI_API_KEY,
+    http_options=types.HttpOptions(
+        # HttpOptions.timeout é em MILISSEGUNDOS (300_000 = 300 s).
+        timeout=300_000,
+        async_client_args={
+            "limits": _HTTPX_LIMITS,
+            "timeout": httpx.Timeout(300.0, connect=10.0),
+        },
+    ),
+)
+
 POLITICA_JUSCASH = """
 Regra-base (elegibilidade)
 POL-1: Só compramos crédito de processos transitados em julgado e em fase de execução.
@@ -68,80 +137,335 @@ Saídas e qualidade (Incompleto - incomplete)
 POL-8: Se faltar documento essencial (ex.: trânsito em julgado não comprovado) INCOMPLETE.
 """
 
-def verificar_processo_llm_gemini(processo: ProcessoJudicial) -> DecisaoProcesso:
+def _chave_cache(processo: ProcessoJudicial) -> str:
     """
-    Usa o Gemini para verificar a conformidade do processo com a Política, 
-    forçando a saída estruturada pelo Pydantic Schema.
+    Chave canônica do payload para cache: campos ordenados e valorCondenacao
+    agrupado em faixas de R$ 100 (piso, para não cruzar o limite da POL-3).
     """
-    global GEMINI_API_KEY
-    
-    # 1. Verificação da Chave
-    if not GEMINI_API_KEY:
-        raise ConnectionError("Chave GEMINI_API_KEY não configurada no ambiente.")
-
-    # 2. Inicialização do Cliente (Passando a chave diretamente, a solução robusta)
-    # No seu src/main.py, dentro da função verificar_processo_llm_gemini
-
-# 2. Inicialização do Cliente Gemini COM HttpOptions para Timeout
-try:
-    # Define o timeout na configuração HTTP (60 segundos)
-    http_options = types.HttpOptions(
-        timeout=300 
-    )
-    
-    # O cliente é inicializado com a chave E a configuração de HTTP/Timeout
-    client = genai.Client(
-        api_key=GEMINI_API_KEY,
-        http_options=http_options
-    )
-except Exception as e:
-    raise ConnectionError(f"Erro ao inicializar o cliente Gemini: {e}")
+    dados = processo.model_dump()
+    dados["valorCondenacao"] = int(dados["valorCondenacao"] // 100) * 100
+    return orjson.dumps(dados, option=orjson.OPT_SORT_KEYS).decode()
+
 
-    # 3. Instrução (Prompt)
-    prompt = f"""
+# Prefixo estático do prompt (persona + política). Com o context caching do
+# Gemini este bloco fica retido no servidor e cada requisição transmite (e
+# tokeniza) apenas os dados do processo.
+_PROMPT_ESTATICO = f"""
     Você é o Analista de Machine Learning da JusCash. Aplique as regras da Política JusCash
     abaixo nos dados do processo e retorne a sua análise no formato JSON exigido.
 
     # Regras da Política JusCash:
     {POLITICA_JUSCASH}
+"""
+
+# Configs de geração pré-construídas: o GenerateContentConfig converte o
+# schema Pydantic em JSON Schema ao ser montado, então construí-lo uma única
+# vez tira essa introspecção do caminho quente.
+_GEN_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=DecisaoProcesso,
+)
+
+_CACHED_POLITICA = None
+_GEN_CONFIG_CACHED = None
 
-    # Dados do Processo:
-    {json.dumps(processo.model_dump(), indent=2)}
 
-    Determine a decisão ('approved', 'rejected', 'incomplete') e cite as regras (POL-X) que a justificam.
+def _ativar_cache_politica() -> None:
     """
+    (Re)cria o cached-content da política e a config que o referencia.
+    Chamada no import e novamente quando a referência expira (TTL de 3600s).
+    """
+    global _CACHED_POLITICA, _GEN_CONFIG_CACHED
+    try:
+        _CACHED_POLITICA = _GEMINI_CLIENT.caches.create(
+            model='gemini-2.5-flash',
+            config=types.CreateCachedContentConfig(
+                contents=[_PROMPT_ESTATICO],
+                ttl="3600s",
+            ),
+        )
+        _GEN_CONFIG_CACHED = types.GenerateContentConfig(
+            response_mime_type="application/json",
+            response_schema=DecisaoProcesso,
+            cached_content=_CACHED_POLITICA.name,
+        )
+    except Exception as e:
+        # Prefixo abaixo do mínimo de tokens ou API indisponível: o serviço
+        # segue enviando o prompt completo em cada chamada.
+        _CACHED_POLITICA = None
+        _GEN_CONFIG_CACHED = None
+        print(f"Aviso: context caching do Gemini indisponível ({e})")
+
+
+_ativar_cache_politica()
+
+
+def _falha_de_cached_content(e: Exception) -> bool:
+    """O erro veio da referência de cached-content (expirada ou apagada)?"""
+    if _CACHED_POLITICA is None:
+        # A chamada nem usou cached-content.
+        return False
+    if not isinstance(e, genai_errors.APIError):
+        return False
+    return e.code in (403, 404) and "cach" in str(e).lower()
+
+
+def apply_policy_rules(processo: ProcessoJudicial) -> Optional[DecisaoProcesso]:
+    """
+    Pré-análise determinística: as regras POL-3/4/5/6/8 mapeiam 1:1 nos campos
+    de ProcessoJudicial e não precisam de LLM. Retorna a decisão pronta quando
+    alguma regra objetiva dispara, ou None para os casos que exigem análise.
+    """
+    # Regras de rejeição (terminais): acumula todas as que dispararem.
+    motivos = []
+    if processo.valorCondenacao < 1000:
+        motivos.append(("POL-3", "Valor de condenação abaixo de R$ 1.000,00."))
+    if processo.esfera.strip().lower() == "trabalhista":
+        motivos.append(("POL-4", "Condenação na esfera trabalhista."))
+    if processo.obito_autor:
+        motivos.append(("POL-5", "Óbito do autor sem habilitação no inventário."))
+    if processo.substabelecimento_sem_reserva:
+        motivos.append(("POL-6", "Substabelecimento sem reserva de poderes."))
+    if motivos:
+        return DecisaoProcesso(
+            decision="rejected",
+            rationale=" ".join(texto for _, texto in motivos),
+            citacoes=[regra for regra, _ in motivos],
+        )
+
+    # Documentação incompleta (POL-8): inclui trânsito em julgado não comprovado.
+    if processo.documentos_faltando or not processo.transitou_julgado:
+        return DecisaoProcesso(
+            decision="incomplete",
+            rationale="Falta documento essencial (ex.: trânsito em julgado não comprovado).",
+            citacoes=["POL-8"],
+        )
+
+    # Caso genuinamente ambíguo: segue para o LLM.
+    return None
+
+
+def _digest_payload(processo: ProcessoJudicial) -> str:
+    """Digest SHA-256 do payload normalizado (chave do cache exato)."""
+    canonico = orjson.dumps(processo.model_dump(), option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(canonico).hexdigest()
+
+
+# Pedaços pré-montados da parte variável do prompt: no caminho quente sobra
+# só a concatenação, sem reinterpolar o template a cada requisição.
+_PROMPT_HEAD = "\n    # Dados do Processo:\n    "
+_PROMPT_TAIL = (
+    "\n\n    Determine a decisão ('approved', 'rejected', 'incomplete') "
+    "e cite as regras (POL-X) que a justificam.\n    "
+)
+
+
+def _montar_prompt_dados(processo: ProcessoJudicial) -> str:
+    """
+    Parte variável do prompt: os dados do processo + instrução final.
+    model_dump_json (serializador nativo do Pydantic v2) evita o dict
+    intermediário e sai compacto — sem indent, menos tokens de entrada.
+    """
+    return _PROMPT_HEAD + processo.model_dump_json() + _PROMPT_TAIL
+
+
+def _montar_contents_config(prompt_dados: str):
+    """Monta (contents, config) conforme o prefixo cacheado esteja disponível."""
+    if _CACHED_POLITICA is not None and _GEN_CONFIG_CACHED is not None:
+        return [prompt_dados], _GEN_CONFIG_CACHED
+    return [_PROMPT_ESTATICO + prompt_dados], _GEN_CONFIG
 
-    # 4. Configuração de Geração com Structured Output
-    config = types.GenerateContentConfig(
-        response_mime_type="application/json",
-        response_schema=DecisaoProcesso, 
-    )
 
-    # 5. Chamada à API
+async def _gerar_conteudo(prompt_dados: str):
+    """
+    generate_content com fallback de cache: se a falha vier da referência de
+    cached-content (403/404 depois do TTL de 3600s), renova o cache para as
+    próximas requisições e refaz esta chamada uma única vez com o prompt
+    completo. Outras falhas (rate limit, timeout, rede) propagam direto, sem
+    pagar uma segunda chamada nem desativar o cache.
+    """
+    contents, config = _montar_contents_config(prompt_dados)
     try:
-        response = client.models.generate_content(
+        return await _GEMINI_CLIENT.aio.models.generate_content(
             model='gemini-2.5-flash',
-            contents=[prompt],
+            contents=contents,
             config=config,
-            
         )
-        
-        # 6. Verificação de Conteúdo Vazio ou Erro
-    if not response.text:
-        # Se a resposta estiver vazia (a causa do erro JSON)
-        raise RuntimeError("O LLM Gemini não retornou nenhum texto (Resposta vazia). Verifique a chave e limites de uso.")
+    except Exception as e:
+        if not _falha_de_cached_content(e):
+            raise
+        # caches.create é síncrono: renova fora do event loop.
+        await asyncio.to_thread(_ativar_cache_politica)
+        return await _GEMINI_CLIENT.aio.models.generate_content(
+            model='gemini-2.5-flash',
+            contents=[_PROMPT_ESTATICO + prompt_dados],
+            config=_GEN_CONFIG,
+        )
+
+
+async def _gerar_conteudo_stream(prompt_dados: str):
+    """
+    Variante streaming de _gerar_conteudo, com o mesmo fallback de
+    cached-content. O erro da referência só aparece ao pedir o primeiro
+    chunk (não ao abrir o stream), então ele é puxado aqui dentro: o retry
+    acontece antes de qualquer chunk chegar ao cliente.
+    """
+    contents, config = _montar_contents_config(prompt_dados)
+    stream = await _GEMINI_CLIENT.aio.models.generate_content_stream(
+        model='gemini-2.5-flash',
+        contents=contents,
+        config=config,
+    )
+    try:
+        primeiro = await anext(stream)
+    except StopAsyncIteration:
+        return
+    except Exception as e:
+        if not _falha_de_cached_content(e):
+            raise
+        # caches.create é síncrono: renova fora do event loop.
+        await asyncio.to_thread(_ativar_cache_politica)
+        stream = await _GEMINI_CLIENT.aio.models.generate_content_stream(
+            model='gemini-2.5-flash',
+            contents=[_PROMPT_ESTATICO + prompt_dados],
+            config=_GEN_CONFIG,
+        )
+        async for pedaco in stream:
+            yield pedaco
+        return
+
+    yield primeiro
+    async for pedaco in stream:
+        yield pedaco
+
+
+async def verificar_processo_llm_gemini(processo: ProcessoJudicial) -> DecisaoProcesso:
+    """
+    Usa o Gemini para verificar a conformidade do processo com a Política,
+    forçando a saída estruturada pelo Pydantic Schema.
+
+    A chamada usa o cliente assíncrono (client.aio) para que o event loop
+    do Uvicorn possa multiplexar várias requisições durante a espera do LLM.
+    O cliente é o singleton de módulo (_GEMINI_CLIENT), reaproveitando as
+    conexões keepalive entre requisições.
+    """
+    # 0. Regras determinísticas: casos óbvios nem chegam aos caches/LLM.
+    decisao_regras = apply_policy_rules(processo)
+    if decisao_regras is not None:
+        return decisao_regras
+
+    # 1. Cache exato: payload byte-idêntico já decidido volta em sub-ms.
+    digest = _digest_payload(processo)
+    em_cache = _EXACT_CACHE.get(digest)
+    if em_cache is not None:
+        return _DECISAO_ADAPTER.validate_json(em_cache)
+
+    # 2. Cache semântico: payloads próximos já decididos não vão ao LLM.
+    chave = _chave_cache(processo)
+    if _SEMANTIC_CACHE is not None:
+        try:
+            # check/store são síncronos (embedding + I/O Redis): rodam no
+            # threadpool para não travar o event loop sob concorrência.
+            hit = await asyncio.to_thread(_SEMANTIC_CACHE.check, prompt=chave, num_results=1)
+            if hit:
+                decisao = _DECISAO_ADAPTER.validate_json(hit[0]["response"])
+                _EXACT_CACHE[digest] = decisao.model_dump_json()
+                return decisao
+        except Exception:
+            pass  # Falha do cache não pode derrubar a verificação.
+
+    # 3. Instrução (Prompt): só a parte variável (dados do processo)
+    prompt_dados = _montar_prompt_dados(processo)
+
+    # 4/5. Chamada à API (assíncrona, com fallback de cached-content)
+    try:
+        response = await _gerar_conteudo(prompt_dados)
+
+        # 6. Verificação de Bloqueio de Segurança
+        # (prompt_feedback vem None em respostas bem-sucedidas; o block_reason
+        # é um enum, então comparar com 0 rejeitava respostas válidas. Checado
+        # antes do texto vazio, porque prompt bloqueado também vem sem texto.)
+        if response.prompt_feedback and response.prompt_feedback.block_reason:
+            # Se o Gemini bloquear o prompt por segurança (BlockReason.SAFETY)
+            raise RuntimeError(f"O Prompt foi bloqueado por motivo de segurança: {response.prompt_feedback.block_reason.name}")
 
-    # 7. Verificação de Bloqueio de Segurança
-    if response.prompt_feedback.block_reason != 0:
-        # Se o Gemini bloquear o prompt por segurança (BlockReason.SAFETY)
-        raise RuntimeError(f"O Prompt foi bloqueado por motivo de segurança: {response.prompt_feedback.block_reason.name}")
+        # 7. Verificação de Conteúdo Vazio ou Erro
+        if not response.text:
+            # Se a resposta estiver vazia (a causa do erro JSON)
+            raise RuntimeError("O LLM Gemini não retornou nenhum texto (Resposta vazia). Verifique a chave e limites de uso.")
 
-    # 8. Retorno do Objeto Pydantic (Só acontece se o texto não for vazio)
-    return DecisaoProcesso.model_validate_json(response.text)
+        # 8. Validação do Objeto Pydantic (Só acontece se o texto não for vazio)
+        # validate_json direto nos bytes evita um re-parse via str.
+        decisao = _DECISAO_ADAPTER.validate_json(response.text.encode())
 
-except Exception as e:
-    # Captura o erro e repassa para a API
-    raise RuntimeError(f"Erro na chamada do modelo Gemini: {e}")
+        # 9. Alimenta os caches para as próximas requisições.
+        serializada = decisao.model_dump_json()
+        _EXACT_CACHE[digest] = serializada
+        if _SEMANTIC_CACHE is not None:
+            try:
+                await asyncio.to_thread(_SEMANTIC_CACHE.store, prompt=chave, response=serializada)
+            except Exception:
+                pass  # Cache é melhor-esforço.
+
+        return decisao
+
+    except Exception as e:
+        # Captura o erro e repassa para a API
+        raise RuntimeError(f"Erro na chamada do modelo Gemini: {e}")
+
+
+async def _stream_verificacao(processo: ProcessoJudicial):
+    """
+    Gera os pedaços de texto da decisão, na ordem regras -> caches -> Gemini.
+    Casos determinísticos/cacheados saem num único pedaço; o residual ambíguo
+    vem chunk a chunk de generate_content_stream, com validação ao final.
+    """
+    decisao_regras = apply_policy_rules(processo)
+    if decisao_regras is not None:
+        yield decisao_regras.model_dump_json()
+        return
+
+    digest = _digest_payload(processo)
+    em_cache = _EXACT_CACHE.get(digest)
+    if em_cache is not None:
+        yield em_cache
+        return
+
+    chave = _chave_cache(processo)
+    if _SEMANTIC_CACHE is not None:
+        try:
+            # check/store são síncronos (embedding + I/O Redis): rodam no
+            # threadpool para não travar o event loop sob concorrência.
+            hit = await asyncio.to_thread(_SEMANTIC_CACHE.check, prompt=chave, num_results=1)
+            if hit:
+                serializada = hit[0]["response"]
+                _DECISAO_ADAPTER.validate_json(serializada)
+                _EXACT_CACHE[digest] = serializada
+                yield serializada
+                return
+        except Exception:
+            pass  # Falha do cache não pode derrubar a verificação.
+
+    texto = ""
+    try:
+        # Mesmo fallback de cached-content do caminho não-stream; o retry
+        # acontece antes de qualquer chunk sair.
+        async for pedaco in _gerar_conteudo_stream(_montar_prompt_dados(processo)):
+            if pedaco.text:
+                texto += pedaco.text
+                yield pedaco.text
+    except Exception as e:
+        raise RuntimeError(f"Erro na chamada do modelo Gemini: {e}")
+
+    # O schema força JSON, mas só o texto completo é validável.
+    decisao = _DECISAO_ADAPTER.validate_json(texto.encode())
+    serializada = decisao.model_dump_json()
+    _EXACT_CACHE[digest] = serializada
+    if _SEMANTIC_CACHE is not None:
+        try:
+            await asyncio.to_thread(_SEMANTIC_CACHE.store, prompt=chave, response=serializada)
+        except Exception:
+            pass  # Cache é melhor-esforço.
 
 
 # ==============================================================================
@@ -152,24 +476,49 @@ app = FastAPI(
     title="JusCash LLM Verifier API",
     description="API para validação de processos judiciais usando Gemini e Pydantic.",
     version="1.0.0",
+    # orjson (Rust): serialização de resposta várias vezes mais rápida que o
+    # json da stdlib e sem escapar acentos (rationale sai em UTF-8 puro).
+    default_response_class=ORJSONResponse,
 )
 
+# Estado do probe profundo de /health: memoizado por 30s sob lock para que
+# load balancers consultando ?deep=1 não bombardeiem a API do Gemini.
+_last_probe = {"t": 0.0, "ok": False}
+_probe_lock = asyncio.Lock()
+
 # Endpoint de Saúde (Obrigatório: /health)
 @app.get("/health", summary="Verificação de saúde da API")
-def health_check():
-    """Retorna o status 'ok' para indicar que a API está rodando."""
-    return {"status": "ok", "message": "API operacional"}
+async def health_check(deep: bool = False):
+    """
+    Retorna o status 'ok' para indicar que a API está rodando. Com ?deep=1
+    faz também um probe mínimo no Gemini (memoizado por 30s) e responde
+    'degraded' quando credenciais/conectividade estão quebradas — assim o
+    load balancer para de rotear para um worker que só devolveria 500.
+    """
+    if not deep:
+        return {"status": "ok", "message": "API operacional"}
+
+    async with _probe_lock:
+        if time.time() - _last_probe["t"] < 30:
+            return {"status": "ok" if _last_probe["ok"] else "degraded"}
+        try:
+            await _GEMINI_CLIENT.aio.models.list()
+            _last_probe.update(t=time.time(), ok=True)
+        except Exception:
+            _last_probe.update(t=time.time(), ok=False)
+
+    return {"status": "ok" if _last_probe["ok"] else "degraded"}
 
 # Endpoint Principal (para verificar o processo)
 @app.post("/verificar", response_model=DecisaoProcesso, summary="Analisa o processo e retorna a decisão estruturada")
-def verificar_processo(processo: ProcessoJudicial):
+async def verificar_processo(processo: ProcessoJudicial):
     """
     Recebe os dados de um processo judicial e retorna uma decisão estruturada
     (approved, rejected, incomplete) com justificativa e citações.
     """
     try:
-        # Chama a lógica principal de verificação LLM
-        decisao = verificar_processo_llm_gemini(processo)
+        # Chama a lógica principal de verificação LLM (sem bloquear o event loop)
+        decisao = await verificar_processo_llm_gemini(processo)
         return decisao
     
     except ConnectionError as e:
@@ -188,11 +537,53 @@ def verificar_processo(processo: ProcessoJudicial):
             status_code=500, detail=f"Erro Interno Inesperado: {e}"
         )
 
+# Endpoint de Lote (para submissões em massa)
+@app.post("/verificar/batch", response_model=List[DecisaoProcesso], summary="Analisa vários processos em paralelo")
+async def verificar_batch(processos: List[ProcessoJudicial]):
+    """
+    Recebe uma lista de processos e despacha todas as verificações
+    concorrentemente (asyncio.gather sobre o cliente assíncrono), em vez de
+    N round-trips seriais. Falhas individuais viram entradas 'error' na
+    posição correspondente, sem derrubar o lote inteiro.
+    """
+    resultados = await asyncio.gather(
+        *(verificar_processo_llm_gemini(p) for p in processos),
+        return_exceptions=True,
+    )
+    return [
+        r if isinstance(r, DecisaoProcesso)
+        else DecisaoProcesso(decision="error", rationale=str(r), citacoes=[])
+        for r in resultados
+    ]
+
+# Endpoint de Streaming (SSE): mesmos dados, primeira resposta mais cedo
+@app.post("/verificar/stream", summary="Analisa o processo e transmite a decisão via Server-Sent Events")
+async def verificar_processo_stream(processo: ProcessoJudicial):
+    """
+    Variante streaming de /verificar: os pedaços da decisão chegam como
+    eventos SSE (`data: <json-string>`), encerrados por `data: "[DONE]"`.
+    Erros são sinalizados com `event: error` em vez de status HTTP, já que
+    os headers saem antes de o LLM terminar.
+    """
+    async def gerador():
+        try:
+            async for pedaco in _stream_verificacao(processo):
+                # json.dumps escapa quebras de linha, preservando o framing SSE.
+                yield f"data: {json.dumps(pedaco)}\n\n"
+            yield 'data: "[DONE]"\n\n'
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps(str(e))}\n\n"
+
+    return StreamingResponse(gerador(), media_type="text/event-stream")
+
 # ==============================================================================
 # 4. INSTRUÇÕES DE EXECUÇÃO
 # ==============================================================================
-# Para rodar a API localmente, execute o comando:
+# Para rodar a API localmente (dev), execute o comando:
 # uvicorn main:app --reload --host 0.0.0.0 --port 8000
+#
+# Em produção (ver start.sh), use múltiplos workers + uvloop/httptools:
+# uvicorn main:app --host 0.0.0.0 --port 8000 --workers 5 --loop uvloop --http httptools --log-level warning
 
 # Exemplo de uso (Não é necessário rodar no Colab/notebook, mas mantém a estrutura)
 '''
@@ -4,8 +4,12 @@
 echo "Iniciando a API FastAPI em background na porta 8000..."
 # Inicia a API Uvicorn (FastAPI) e envia para o background (&)
 # --host 0.0.0.0 é crucial para ambientes de container
-# Não use --reload em produção!
-uvicorn main:app --host 0.0.0.0 --port 8000 &
+# Config de produção: 5 workers (2*cores+1 p/ 2 vCPUs) exploram todos os
+# núcleos; uvloop/httptools (do uvicorn[standard]) aceleram o event loop e o
+# parse HTTP. Não use --reload em produção!
+uvicorn main:app --host 0.0.0.0 --port 8000 \
+    --workers "${UVICORN_WORKERS:-5}" --loop uvloop --http httptools \
+    --log-level warning &
 
 echo "Aguardando 5 segundos para a API iniciar..."
 sleep 5